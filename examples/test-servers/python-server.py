@@ -8,14 +8,190 @@ Supports basic tools: echo, add, and get_time for comprehensive protocol testing
 
 import asyncio
 import json
+import os
+import stat
 import sys
 import datetime
-from typing import Dict, Any, List
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Union
+
+# uvloop is optional (Linux/macOS only): when it is installed it replaces the
+# stock asyncio event loop, otherwise the servers run on plain asyncio
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# orjson is optional: when it is installed it replaces the stdlib codec.
+# _dumpb always returns UTF-8 bytes ready to be written to the transport.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumpb(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Every response starts with this; pre-serialized responses splice the
+# request id in after it
+_RESPONSE_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+
+def _id_to_json(req_id: Any) -> bytes:
+    """Serialize a request id, formatting plain integer ids directly"""
+    # Exact type check: bool is an int subclass but must encode as true/false
+    if req_id.__class__ is int:
+        return b"%d" % req_id
+    return _dumpb(req_id)
+
+
+def _result_response(req_id: Any, result_json: bytes) -> bytes:
+    """Splice an already serialized result into a success response"""
+    return _RESPONSE_PREFIX + _id_to_json(req_id) + b',"result":' + result_json + b'}'
+
+
+# Most bytes taken from stdin per read, and the reader's buffer limit
+_STDIO_READ_SIZE = 64 * 1024
+_STDIO_READ_LIMIT = 16 * 1024 * 1024
+
+# Responses bypass sys.stdout's text layer and go straight to the fd
+_STDOUT_FD = sys.stdout.fileno()
+
+# Shared read-only default for missing params/arguments, so lookups don't
+# allocate a fresh {} per request
+_EMPTY_DICT = MappingProxyType({})
+
+# How long a formatted timestamp is reused before it is regenerated
+_TIME_CACHE_SECONDS = 0.1
+
+# [monotonic time of last refresh, formatted timestamp]
+_time_cache = [float("-inf"), ""]
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, refreshed at most every 100ms"""
+    now = time.monotonic()
+    if now - _time_cache[0] > _TIME_CACHE_SECONDS:
+        _time_cache[0] = now
+        _time_cache[1] = datetime.datetime.now().isoformat()
+    return _time_cache[1]
+
+
+def _do_echo(arguments: Dict[str, Any]) -> str:
+    """echo tool: return the input text"""
+    text = arguments.get("text", "")
+    return f"Echo: {text}"
+
+
+def _do_add(arguments: Dict[str, Any]) -> str:
+    """add tool: sum two numbers
+
+    Deliberately plain Python: for one scalar pair a JIT (e.g. Numba) would
+    cost more in dispatch than the addition. That only pays off for a
+    batched variant that adds many (a, b) pairs in a single tools/call.
+    """
+    a = arguments.get("a", 0)
+    b = arguments.get("b", 0)
+    return "Result: " + str(a + b)
+
+
+def _do_time(arguments: Dict[str, Any]) -> str:
+    """get_time tool: report the current local time"""
+    current_time = _now_iso()
+    return f"Current time: {current_time}"
+
+
+# Tool name -> implementation, looked up once per tools/call
+_TOOL_IMPLS = {
+    "echo": _do_echo,
+    "add": _do_add,
+    "get_time": _do_time,
+}
+
+
+def _method_not_found(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the JSON-RPC error response for an unknown method"""
+    return {
+        "jsonrpc": "2.0",
+        "id": request.get("id"),
+        "error": {
+            "code": -32601,
+            "message": f"Method not found: {request.get('method')}"
+        }
+    }
+
+
+def _stdin_is_pollable() -> bool:
+    """Whether stdin is a pipe, socket or tty the event loop can watch"""
+    mode = os.fstat(0).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or os.isatty(0)
+
+
+def _write_stdout(payload: bytes) -> None:
+    """Write a serialized response line to stdout with raw os.write calls"""
+    view = memoryview(payload)
+    while view:
+        written = os.write(_STDOUT_FD, view)
+        view = view[written:]
+
+
+# Tool schemas, built once at import and shared by every server instance
+_TOOLS = (
+    {
+        "name": "echo",
+        "description": "Echo back the input text",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to echo back"
+                }
+            },
+            "required": ["text"]
+        }
+    },
+    {
+        "name": "add",
+        "description": "Add two numbers together",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "a": {
+                    "type": "number",
+                    "description": "First number"
+                },
+                "b": {
+                    "type": "number",
+                    "description": "Second number"
+                }
+            },
+            "required": ["a", "b"]
+        }
+    },
+    {
+        "name": "get_time",
+        "description": "Get the current time",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    },
+)
 
 
 class MCPTestServer:
     """Minimal MCP server for testing protocol compliance"""
     
+    tools = _TOOLS
+    # tools/list never changes, so its result is serialized once and shared
+    _tools_list_result = _dumpb({"tools": _TOOLS})
+    
     def __init__(self):
         self.server_info = {
             "name": "python-test-server",
@@ -24,116 +200,52 @@ class MCPTestServer:
         self.capabilities = {
             "tools": {"listChanged": True}
         }
-        self.tools = [
-            {
-                "name": "echo",
-                "description": "Echo back the input text",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "Text to echo back"
-                        }
-                    },
-                    "required": ["text"]
-                }
-            },
-            {
-                "name": "add",
-                "description": "Add two numbers together",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "a": {
-                            "type": "number",
-                            "description": "First number"
-                        },
-                        "b": {
-                            "type": "number",
-                            "description": "Second number"
-                        }
-                    },
-                    "required": ["a", "b"]
-                }
-            },
-            {
-                "name": "get_time",
-                "description": "Get the current time",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "additionalProperties": False
-                }
-            }
-        ]
 
-    async def handle_initialize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # The initialize result never changes either; serialize it once here
+        # and only splice the request id in per call
+        self._initialize_result = _dumpb({
+            "protocolVersion": "2025-03-26",
+            "capabilities": self.capabilities,
+            "serverInfo": self.server_info
+        })
+
+    def handle_initialize(self, request: Dict[str, Any]) -> bytes:
         """Handle initialize request"""
-        return {
-            "jsonrpc": "2.0",
-            "id": request["id"],
-            "result": {
-                "protocolVersion": "2025-03-26",
-                "capabilities": self.capabilities,
-                "serverInfo": self.server_info
-            }
-        }
+        return _result_response(request["id"], self._initialize_result)
 
-    async def handle_list_tools(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_list_tools(self, request: Dict[str, Any]) -> bytes:
         """Handle tools/list request"""
-        return {
-            "jsonrpc": "2.0",
-            "id": request["id"],
-            "result": {
-                "tools": self.tools
-            }
-        }
+        return _result_response(request["id"], self._tools_list_result)
+
+    def handle_call_tool(
+        self, request: Dict[str, Any]
+    ) -> Union[Dict[str, Any], bytes]:
+        """Handle tools/call request
 
-    async def handle_call_tool(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle tools/call request"""
-        params = request.get("params", {})
+        Successful calls are serialized straight to bytes; errors keep the
+        response dict.
+        """
+        params = request.get("params", _EMPTY_DICT)
         tool_name = params.get("name")
-        arguments = params.get("arguments", {})
+        arguments = params.get("arguments", _EMPTY_DICT)
         
-        try:
-            if tool_name == "echo":
-                text = arguments.get("text", "")
-                content = [{
-                    "type": "text",
-                    "text": f"Echo: {text}"
-                }]
-            elif tool_name == "add":
-                a = arguments.get("a", 0)
-                b = arguments.get("b", 0)
-                result = a + b
-                content = [{
-                    "type": "text",
-                    "text": f"Result: {result}"
-                }]
-            elif tool_name == "get_time":
-                current_time = datetime.datetime.now().isoformat()
-                content = [{
-                    "type": "text",
-                    "text": f"Current time: {current_time}"
-                }]
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request["id"],
-                    "error": {
-                        "code": -32601,
-                        "message": f"Unknown tool: {tool_name}"
-                    }
-                }
-            
+        tool_impl = _TOOL_IMPLS.get(tool_name)
+        if tool_impl is None:
             return {
                 "jsonrpc": "2.0",
                 "id": request["id"],
-                "result": {
-                    "content": content
+                "error": {
+                    "code": -32601,
+                    "message": f"Unknown tool: {tool_name}"
                 }
             }
+        
+        try:
+            content = [{
+                "type": "text",
+                "text": tool_impl(arguments)
+            }]
+            return _result_response(request["id"], _dumpb({"content": content}))
         except Exception as e:
             return {
                 "jsonrpc": "2.0",
@@ -144,64 +256,107 @@ class MCPTestServer:
                 }
             }
 
-    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Route request to appropriate handler"""
+    def handle_request(
+        self, request: Dict[str, Any]
+    ) -> Union[Dict[str, Any], bytes]:
+        """Route request to appropriate handler
+
+        Returns either a response dict or an already serialized response.
+        Nothing on the request path awaits, so routing and the method
+        handlers are plain functions and a request enters no coroutine.
+        """
         method = request.get("method")
         
-        if method == "initialize":
-            return await self.handle_initialize(request)
-        elif method == "tools/list":
-            return await self.handle_list_tools(request)
-        elif method == "tools/call":
-            return await self.handle_call_tool(request)
-        else:
-            return {
+        handler = _METHOD_HANDLERS.get(method)
+        if handler is None:
+            return _method_not_found(request)
+        return handler(self, request)
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Parse one JSON-RPC line and return the serialized response"""
+        # Parse JSON request
+        try:
+            request = _loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            error_response = {
                 "jsonrpc": "2.0",
-                "id": request.get("id"),
+                "id": None,
                 "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
+                    "code": -32700,
+                    "message": f"Parse error: {str(e)}"
                 }
             }
+            return _dumpb(error_response)
+        
+        # Handle request
+        response = self.handle_request(request)
+        if not isinstance(response, bytes):
+            response = _dumpb(response)
+        return response
 
     async def run_stdio(self):
         """Run server over stdio transport"""
         print("Python MCP Test Server starting (stdio mode)", file=sys.stderr)
         
+        # Attach stdin to the event loop directly so reads don't hop through
+        # the default thread pool for every message
+        loop = asyncio.get_running_loop()
+        read_chunk = None
+        if _stdin_is_pollable():
+            reader = asyncio.StreamReader(limit=_STDIO_READ_LIMIT)
+            protocol = asyncio.StreamReaderProtocol(reader)
+            try:
+                await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+                read_chunk = lambda: reader.read(_STDIO_READ_SIZE)
+            except ValueError:
+                pass
+        if read_chunk is None:
+            # Regular files (stdin redirected with <) and devices such as
+            # /dev/null can't be watched by the loop; read them through the
+            # thread pool instead
+            stdin = sys.stdin.buffer
+            read_chunk = lambda: loop.run_in_executor(None, stdin.read1, _STDIO_READ_SIZE)
+        
+        # Responses are written synchronously; a blocking fd means a full
+        # pipe simply applies backpressure instead of raising BlockingIOError
+        os.set_blocking(_STDOUT_FD, True)
+        
+        # Bytes read so far that don't yet end in a newline
+        pending = bytearray()
+        
+        # Responses handled but not yet written
+        responses = []
+        
         while True:
             try:
-                # Read line from stdin
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                # Take whatever stdin has buffered; a client that writes a
+                # batch of requests gets all of them handled in one pass
+                chunk = await read_chunk()
                 
-                if not line:
-                    break
+                if chunk:
+                    pending += chunk
+                    end = pending.rfind(b"\n")
+                    if end < 0:
+                        continue
+                    lines = bytes(pending[:end]).split(b"\n")
+                    del pending[:end + 1]
+                else:
+                    # EOF: a final line without a trailing newline still counts
+                    lines = [bytes(pending)]
                 
-                line = line.strip()
-                if not line:
-                    continue
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        responses.append(self.handle_line(line))
                 
-                # Parse JSON request
-                try:
-                    request = json.loads(line)
-                except json.JSONDecodeError as e:
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {
-                            "code": -32700,
-                            "message": f"Parse error: {str(e)}"
-                        }
-                    }
-                    print(json.dumps(error_response), flush=True)
-                    continue
+                # Send every response from this batch with a single write
+                if responses:
+                    batch = b"\n".join(responses) + b"\n"
+                    responses.clear()
+                    _write_stdout(batch)
                 
-                # Handle request
-                response = await self.handle_request(request)
-                
-                # Send response
-                print(json.dumps(response), flush=True)
+                if not chunk:
+                    break
                 
             except KeyboardInterrupt:
                 break
@@ -209,9 +364,24 @@ class MCPTestServer:
                 print(f"Server error: {e}", file=sys.stderr)
                 break
         
+        # A batch cut short by an error still gets the responses it produced
+        if responses:
+            try:
+                _write_stdout(b"\n".join(responses) + b"\n")
+            except OSError:
+                pass
+        
         print("Python MCP Test Server stopped", file=sys.stderr)
 
 
+# JSON-RPC method -> handler, so routing is a single dict lookup per request
+_METHOD_HANDLERS = {
+    "initialize": MCPTestServer.handle_initialize,
+    "tools/list": MCPTestServer.handle_list_tools,
+    "tools/call": MCPTestServer.handle_call_tool,
+}
+
+
 def main():
     """Main entry point"""
     server = MCPTestServer()
@@ -7,163 +7,255 @@ Run with: python websocket_mcp_server.py
 import asyncio
 import json
 import logging
+import time
 import websockets
 from datetime import datetime
+from types import MappingProxyType
 
-# Configure logging
+# uvloop is optional (Linux/macOS only): when it is installed it replaces the
+# stock asyncio event loop, otherwise the servers run on plain asyncio
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# orjson is optional: when it is installed it replaces the stdlib codec.
+# _dumps returns str so responses still go out as text frames.
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads, _dumps = json.loads, json.dumps
+
+# Every response starts with this; pre-serialized responses splice the
+# request id in after it
+_RESPONSE_PREFIX = '{"jsonrpc":"2.0","id":'
+
+
+def _id_to_json(req_id):
+    """Serialize a request id, formatting plain integer ids directly"""
+    # Exact type check: bool is an int subclass but must encode as true/false
+    if req_id.__class__ is int:
+        return str(req_id)
+    return _dumps(req_id)
+
+
+def _result_response(req_id, result_json):
+    """Splice an already serialized result into a success response"""
+    return _RESPONSE_PREFIX + _id_to_json(req_id) + ',"result":' + result_json + '}'
+
+# Shared read-only default for missing params/arguments, so lookups don't
+# allocate a fresh {} per request
+_EMPTY_DICT = MappingProxyType({})
+
+# Configure logging. Per-message logging on the request path uses lazy %s
+# arguments, so it costs next to nothing once INFO is filtered out.
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class _InvalidParams(Exception):
+    """Raised by a tool implementation when its arguments are unusable"""
+
+
+# How long a formatted timestamp is reused before it is regenerated
+_TIME_CACHE_SECONDS = 0.1
+
+# [monotonic time of last refresh, formatted timestamp]
+_time_cache = [float("-inf"), ""]
+
+
+def _now_text():
+    """Current local time as 'YYYY-mm-dd HH:MM:SS', refreshed at most every 100ms"""
+    now = time.monotonic()
+    if now - _time_cache[0] > _TIME_CACHE_SECONDS:
+        _time_cache[0] = now
+        _time_cache[1] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return _time_cache[1]
+
+
+def _tool_search(arguments):
+    """websocket_search tool: canned search result for the query"""
+    query = arguments.get("query", "")
+    if not query:
+        raise _InvalidParams("Invalid parameters: 'query' is required for websocket_search")
+    return f"🔍 WEBSOCKET MCP SEARCH for '{query}': Found comprehensive results via WebSocket connection. Server located relevant information about {query} from distributed sources. [Response from WebSocket MCP Server]"
+
+
+def _tool_time(arguments):
+    """websocket_time tool: current server time"""
+    return f"⏰ WEBSOCKET MCP TIME: {_now_text()} [Timestamp from WebSocket MCP Server]"
+
+
+# Tool name -> implementation, looked up once per tools/call
+_TOOL_IMPLS = {
+    "websocket_search": _tool_search,
+    "websocket_time": _tool_time,
+}
+
+
+# Tool schemas, built once at import and shared by every server instance
+_TOOLS = (
+    {
+        "name": "websocket_search",
+        "description": "Search for information via WebSocket MCP server",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The search query"
+                }
+            },
+            "required": ["query"],
+            "additionalProperties": False
+        }
+    },
+    {
+        "name": "websocket_time",
+        "description": "Get current time from WebSocket server",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    },
+)
+
+
 class WebSocketMCPServer:
+    tools = _TOOLS
+    # tools/list never changes, so its result is serialized once and shared
+    _tools_list_result = _dumps({"tools": _TOOLS})
+    
     def __init__(self):
         self.capabilities = {
             "tools": {}
         }
         
-    async def handle_request(self, request):
-        """Handle MCP protocol requests"""
-        method = request.get("method")
-        params = request.get("params", {})
-        req_id = request.get("id")
+        # The initialize result never changes either; serialize it once here
+        # and only splice the request id in per call
+        self._initialize_result = _dumps({
+            "protocolVersion": "2024-11-05",
+            "capabilities": self.capabilities,
+            "serverInfo": {
+                "name": "websocket-demo-mcp-server",
+                "version": "1.0.0"
+            }
+        })
         
-        logger.info(f"Received request: {method}")
+    async def handle_initialize(self, req_id, params):
+        return _result_response(req_id, self._initialize_result)
+    
+    async def handle_list_tools(self, req_id, params):
+        return _result_response(req_id, self._tools_list_result)
+    
+    async def handle_call_tool(self, req_id, params):
+        tool_name = params.get("name")
+        arguments = params.get("arguments", _EMPTY_DICT)
         
-        if method == "initialize":
+        logger.info("Tool call: %s with arguments: %s", tool_name, arguments)
+        
+        # Validate that arguments is a dict/object
+        if arguments.__class__ is not dict and arguments is not _EMPTY_DICT:
             return {
                 "jsonrpc": "2.0",
                 "id": req_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": self.capabilities,
-                    "serverInfo": {
-                        "name": "websocket-demo-mcp-server",
-                        "version": "1.0.0"
-                    }
+                "error": {
+                    "code": -32602,
+                    "message": f"Invalid parameters: arguments must be a JSON object, got {type(arguments)}"
                 }
             }
         
-        elif method == "tools/list":
+        tool_impl = _TOOL_IMPLS.get(tool_name)
+        if tool_impl is None:
             return {
                 "jsonrpc": "2.0",
                 "id": req_id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "websocket_search",
-                            "description": "Search for information via WebSocket MCP server",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {
-                                        "type": "string",
-                                        "description": "The search query"
-                                    }
-                                },
-                                "required": ["query"],
-                                "additionalProperties": False
-                            }
-                        },
-                        {
-                            "name": "websocket_time",
-                            "description": "Get current time from WebSocket server",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "additionalProperties": False
-                            }
-                        }
-                    ]
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: Unknown tool '{tool_name}'"
                 }
             }
         
-        elif method == "tools/call":
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
-            
-            logger.info(f"Tool call: {tool_name} with arguments: {arguments}")
-            
-            # Validate that arguments is a dict/object
-            if not isinstance(arguments, dict):
-                return {
-                    "jsonrpc": "2.0",
-                    "id": req_id,
-                    "error": {
-                        "code": -32602,
-                        "message": f"Invalid parameters: arguments must be a JSON object, got {type(arguments)}"
-                    }
-                }
-            
-            if tool_name == "websocket_search":
-                query = arguments.get("query", "")
-                if not query:
-                    return {
-                        "jsonrpc": "2.0",
-                        "id": req_id,
-                        "error": {
-                            "code": -32602,
-                            "message": "Invalid parameters: 'query' is required for websocket_search"
-                        }
-                    }
-                result_text = f"🔍 WEBSOCKET MCP SEARCH for '{query}': Found comprehensive results via WebSocket connection. Server located relevant information about {query} from distributed sources. [Response from WebSocket MCP Server]"
-            elif tool_name == "websocket_time":
-                result_text = f"⏰ WEBSOCKET MCP TIME: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [Timestamp from WebSocket MCP Server]"
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": req_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: Unknown tool '{tool_name}'"
-                    }
-                }
-            
+        try:
+            result_text = tool_impl(arguments)
+        except _InvalidParams as e:
             return {
                 "jsonrpc": "2.0",
                 "id": req_id,
-                "result": {
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": result_text
-                        }
-                    ]
+                "error": {
+                    "code": -32602,
+                    "message": str(e)
                 }
             }
         
-        elif method == "notifications/initialized":
-            # No response needed for notifications
-            return None
+        # Successful calls skip the response dict; only the result is encoded
+        return _result_response(req_id, _dumps({
+            "content": [
+                {
+                    "type": "text",
+                    "text": result_text
+                }
+            ]
+        }))
+    
+    async def handle_request(self, request):
+        """Handle MCP protocol requests"""
+        method = request.get("method")
+        params = request.get("params", _EMPTY_DICT)
+        req_id = request.get("id")
+        
+        logger.info("Received request: %s", method)
         
-        else:
+        handler = _METHOD_HANDLERS.get(method)
+        if handler is None:
             return {
                 "jsonrpc": "2.0",
                 "id": req_id,
                 "result": {}
             }
+        return await handler(self, req_id, params)
     
-    async def handle_client(self, websocket, path):
+    async def handle_client(self, websocket):
         """Handle WebSocket client connection"""
-        logger.info(f"Client connected from {websocket.remote_address}")
+        logger.info("Client connected from %s", websocket.remote_address)
         
         try:
             async for message in websocket:
                 try:
                     # Handle ping/pong frames automatically (websockets library handles this)
                     # Only process text messages as JSON
-                    if isinstance(message, str):
-                        request = json.loads(message)
+                    if message.__class__ is str:
+                        request = _loads(message)
+                        
+                        # JSON-RPC notifications carry no id and never get a
+                        # reply, so drop them before any dispatch work
+                        if request.__class__ is dict and "id" not in request:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Ignored notification: %s", request.get("method"))
+                            continue
+                        
                         response = await self.handle_request(request)
                         
                         if response:
-                            response_json = json.dumps(response)
+                            # Handlers return either a dict or an already serialized str
+                            if response.__class__ is str:
+                                response_json = response
+                            else:
+                                response_json = _dumps(response)
                             await websocket.send(response_json)
-                            logger.info(f"Sent response: {response.get('result', {}).get('tools', 'N/A')}")
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Sent response for %s", request.get("method"))
                     else:
                         # Skip binary frames (ping/pong are handled automatically)
                         continue
                         
                 except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON received: {e}")
+                    logger.error("Invalid JSON received: %s", e)
                     error_response = {
                         "jsonrpc": "2.0",
                         "id": None,
@@ -172,9 +264,9 @@ class WebSocketMCPServer:
                             "message": "Parse error"
                         }
                     }
-                    await websocket.send(json.dumps(error_response))
+                    await websocket.send(_dumps(error_response))
                 except Exception as e:
-                    logger.error(f"Error handling request: {e}")
+                    logger.error("Error handling request: %s", e)
                     error_response = {
                         "jsonrpc": "2.0",
                         "id": None,
@@ -183,12 +275,19 @@ class WebSocketMCPServer:
                             "message": f"Internal error: {str(e)}"
                         }
                     }
-                    await websocket.send(json.dumps(error_response))
+                    await websocket.send(_dumps(error_response))
                     
         except websockets.exceptions.ConnectionClosed:
             logger.info("Client disconnected")
         except Exception as e:
-            logger.error(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
+
+# JSON-RPC method -> handler, so routing is a single dict lookup per request
+_METHOD_HANDLERS = {
+    "initialize": WebSocketMCPServer.handle_initialize,
+    "tools/list": WebSocketMCPServer.handle_list_tools,
+    "tools/call": WebSocketMCPServer.handle_call_tool,
+}
 
 async def main():
     """Start the WebSocket MCP server"""
@@ -198,10 +297,10 @@ async def main():
     host = "localhost"
     port = 8765
     
-    logger.info(f"Starting WebSocket MCP server on ws://{host}:{port}")
+    logger.info("Starting WebSocket MCP server on ws://%s:%s", host, port)
     
     async with websockets.serve(server.handle_client, host, port):
-        logger.info(f"✅ WebSocket MCP server ready at ws://{host}:{port}")
+        logger.info("✅ WebSocket MCP server ready at ws://%s:%s", host, port)
         logger.info("Waiting for connections...")
         
         # Keep server running
@@ -20,12 +20,39 @@ Requirements:
 """
 
 import argparse
-import boto3
+import concurrent.futures
 import json
+import queue
+import re
+import shutil
 import sys
+import textwrap
+import threading
 import time
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Optional
+from itertools import chain
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional
+
+# orjson is optional; it parses the CloudWatch record bodies and formats
+# raw responses several times faster than the stdlib json module
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj) -> str:
+        # OPT_NON_STR_KEYS accepts the non-str dict keys json.dumps allows
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
 
 # Available built-in evaluators with descriptions
 BUILTIN_EVALUATORS = {
@@ -56,6 +83,16 @@ BUILTIN_EVALUATORS = {
     },
 }
 
+# Lookups derived from BUILTIN_EVALUATORS, computed once at import
+_EVALUATOR_IDS = tuple(BUILTIN_EVALUATORS)
+_NAME_TO_ID = {info['name']: eid for eid, info in BUILTIN_EVALUATORS.items()}
+_NAMES = tuple(_NAME_TO_ID)
+_DEFAULT_IDS = tuple(eid for eid, info in BUILTIN_EVALUATORS.items() if info['default'])
+
+
+# Matches the color escape sequences used by Colors
+_ANSI_COLOR = re.compile(r'\033\[[0-9;]*m')
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -100,6 +137,11 @@ def print_warning(text: str):
     print(f"{Colors.YELLOW}⚠ {text}{Colors.RESET}")
 
 
+def _visible_len(text: str) -> int:
+    """Length of text as displayed, ignoring ANSI color codes"""
+    return len(_ANSI_COLOR.sub('', text))
+
+
 def interactive_select_evaluators() -> list[str]:
     """
     Interactive TUI for selecting evaluators.
@@ -108,25 +150,51 @@ def interactive_select_evaluators() -> list[str]:
     print_header("Select Evaluators")
     print(f"\n  Use numbers to toggle selection, 'a' for all, 'n' for none, Enter to confirm\n")
 
-    evaluator_ids = list(BUILTIN_EVALUATORS.keys())
-    selected = {eid: info["default"] for eid, info in BUILTIN_EVALUATORS.items()}
+    evaluator_ids = _EVALUATOR_IDS
+    selected = {eid: eid in _DEFAULT_IDS for eid in evaluator_ids}
+
+    def format_row(i: int, eid: str) -> str:
+        info = BUILTIN_EVALUATORS[eid]
+        checkbox = f"{Colors.GREEN}[X]{Colors.RESET}" if selected[eid] else "[ ]"
+        default_marker = f"{Colors.DIM}(default){Colors.RESET}" if info["default"] else ""
+        return f"  {i}. {checkbox} {info['name']:<15} - {info['description']} {default_marker}"
+
+    commands = f"  {Colors.DIM}Commands: 1-{len(evaluator_ids)}=toggle, a=all, n=none, d=defaults, Enter=confirm{Colors.RESET}"
+
+    def screen_lines(answer: str) -> list[int]:
+        # Terminal lines taken by each printed line, from the first row down
+        # to the answered prompt; long lines wrap on narrow terminals
+        columns = shutil.get_terminal_size().columns
+        lines = [format_row(i, eid) for i, eid in enumerate(evaluator_ids, 1)]
+        lines += ["", commands, "", f"  Selection: {answer}"]
+        return [max(1, -(-_visible_len(line) // columns)) for line in lines]
+
+    # On a terminal only the rows that changed are rewritten in place, as
+    # long as nothing wraps; otherwise the whole checklist is cleared and
+    # printed again
+    interactive = sys.stdout.isatty()
+    # Lines from the first row down to the cursor once input() returns
+    lines_up = len(evaluator_ids) + 4
+    redraw = True
 
     while True:
-        # Display current selection
-        for i, eid in enumerate(evaluator_ids, 1):
-            info = BUILTIN_EVALUATORS[eid]
-            checkbox = f"{Colors.GREEN}[X]{Colors.RESET}" if selected[eid] else "[ ]"
-            default_marker = f"{Colors.DIM}(default){Colors.RESET}" if info["default"] else ""
-            print(f"  {i}. {checkbox} {info['name']:<15} - {info['description']} {default_marker}")
+        if redraw:
+            # Display current selection
+            for i, eid in enumerate(evaluator_ids, 1):
+                print(format_row(i, eid))
 
-        print(f"\n  {Colors.DIM}Commands: 1-{len(evaluator_ids)}=toggle, a=all, n=none, d=defaults, Enter=confirm{Colors.RESET}")
+            print(f"\n{commands}")
+            prompt = f"\n  {Colors.BOLD}Selection:{Colors.RESET} "
 
         try:
-            choice = input(f"\n  {Colors.BOLD}Selection:{Colors.RESET} ").strip().lower()
+            answer = input(prompt)
+            choice = answer.strip().lower()
         except (EOFError, KeyboardInterrupt):
             print("\n")
             sys.exit(0)
 
+        previous = selected.copy()
+
         if choice == "":
             # Confirm selection
             break
@@ -138,143 +206,304 @@ def interactive_select_evaluators() -> list[str]:
             selected = {eid: False for eid in evaluator_ids}
         elif choice == "d":
             # Reset to defaults
-            selected = {eid: info["default"] for eid, info in BUILTIN_EVALUATORS.items()}
+            selected = {eid: eid in _DEFAULT_IDS for eid in evaluator_ids}
         elif choice.isdigit():
             idx = int(choice) - 1
             if 0 <= idx < len(evaluator_ids):
                 eid = evaluator_ids[idx]
                 selected[eid] = not selected[eid]
 
-        # Clear previous output (move cursor up)
-        print(f"\033[{len(evaluator_ids) + 4}A\033[J", end="")
+        heights = screen_lines(answer) if interactive else None
+
+        if heights and all(height == 1 for height in heights):
+            # Jump up to each changed row, rewrite it and come back, then
+            # clear the answered prompt so it can be asked again in place
+            updates = []
+            for i, eid in enumerate(evaluator_ids):
+                if selected[eid] != previous[eid]:
+                    up = lines_up - i
+                    updates.append(f"\033[{up}A\r\033[2K{format_row(i + 1, eid)}\033[{up}B\r")
+            updates.append("\033[1A\033[2K")
+            sys.stdout.write("".join(updates))
+            sys.stdout.flush()
+            prompt = f"  {Colors.BOLD}Selection:{Colors.RESET} "
+            redraw = False
+        else:
+            # Clear previous output (move cursor up), counting wrapped
+            # lines when the terminal width is known
+            print(f"\033[{sum(heights) if heights else lines_up}A\033[J", end="")
+            redraw = True
 
     return [eid for eid, is_selected in selected.items() if is_selected]
 
 
+def iter_log_pages(
+    logs_client,
+    log_group: str,
+    start_time: int,
+    end_time: int,
+    filter_pattern: Optional[str] = None
+):
+    """
+    Yield the parsed JSON messages of a log group, one list per page.
+
+    Walks all filter_log_events pages rather than stopping at the first one,
+    so nothing in the time range is silently dropped.
+    """
+    kwargs = {
+        'logGroupName': log_group,
+        'startTime': start_time,
+        'endTime': end_time,
+        'PaginationConfig': {'PageSize': 10000},
+    }
+    if filter_pattern:
+        kwargs['filterPattern'] = filter_pattern
+
+    paginator = logs_client.get_paginator('filter_log_events')
+    for page in paginator.paginate(**kwargs):
+        yield [_json_loads(e['message']) for e in page.get('events', [])]
+
+
+# filterPattern conditions applied to every aws/spans query
+_SPAN_FILTER_TERMS = (
+    '$.name != "InternalOperation"',
+    '$.name != "parallel_group*"',
+)
+
+
+def _pattern_string(value: str) -> str:
+    """Quote a value for a filterPattern, escaping backslashes and quotes"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _filter_pattern(terms: list) -> Optional[str]:
+    """Join filterPattern conditions into a single JSON pattern, or None"""
+    if not terms:
+        return None
+    return '{ ' + ' && '.join(f'({term})' for term in terms) + ' }'
+
+
+# Parsed pages a log query may have waiting for the consumer
+_PAGE_QUEUE_SIZE = 4
+
+
+class TelemetryUnavailable(Exception):
+    """Raised by get_cloudwatch_data after it has reported a fatal query error"""
+
+
 def get_cloudwatch_data(
     logs_client,
     agent_id: str,
     time_range_minutes: int = 60,
     session_id: Optional[str] = None
-) -> tuple[list, list]:
+) -> Iterator[tuple[str, dict]]:
     """
-    Retrieve spans and events from CloudWatch for the specified agent.
+    Stream spans and events from CloudWatch for the specified agent.
 
-    Returns:
-        Tuple of (spans, events)
+    Records are yielded page by page as each query returns them, so
+    callers keep only what they index rather than every raw record.
+
+    When session_id is given, the filter is applied server-side so only
+    that session's records are downloaded. Spans that never reach an
+    evaluator are filtered out server-side too.
+
+    Yields:
+        ('span', record) or ('event', record) tuples
+
+    Raises:
+        TelemetryUnavailable: the runtime log group could not be read; the
+            error has already been printed and records yielded so far
+            should be discarded
     """
     log_group = f"/aws/bedrock-agentcore/runtimes/{agent_id}"
 
     end_time = int(time.time() * 1000)
     start_time = end_time - (time_range_minutes * 60 * 1000)
 
-    # Get events from runtime log group
-    try:
-        response = logs_client.filter_log_events(
-            logGroupName=log_group,
-            startTime=start_time,
-            endTime=end_time,
-            limit=500
-        )
-        all_events = [json.loads(e['message']) for e in response.get('events', [])]
-    except logs_client.exceptions.ResourceNotFoundException:
-        print_error(f"Log group not found: {log_group}")
-        print(f"  Make sure the agent has been run with CloudWatch telemetry enabled.")
-        return [], []
-    except Exception as e:
-        print_error(f"Error querying log group: {e}")
-        return [], []
-
-    # Get spans from aws/spans
-    try:
-        response = logs_client.filter_log_events(
-            logGroupName='aws/spans',
-            startTime=start_time,
-            endTime=end_time,
-            limit=500
-        )
-        all_spans = [json.loads(s['message']) for s in response.get('events', [])]
-    except Exception as e:
-        print_warning(f"Error querying aws/spans: {e}")
-        all_spans = []
-
-    # Filter by session_id if specified
+    # Spans that build_session_spans discards anyway (InternalOperation and
+    # the parallel_group wrappers) are dropped server-side as well
+    event_terms = []
+    span_terms = list(_SPAN_FILTER_TERMS)
     if session_id:
-        all_events = [e for e in all_events if e.get('attributes', {}).get('session.id') == session_id]
-        all_spans = [s for s in all_spans if s.get('attributes', {}).get('session.id') == session_id]
+        session_term = f'$.attributes."session.id" = {_pattern_string(session_id)}'
+        event_terms.append(session_term)
+        span_terms.insert(0, session_term)
+
+    # Workers hand over (kind, records, error) per page; records=None marks
+    # the end of that query, with error set if it failed. The queue is
+    # bounded so the queries can't run far ahead of the consumer.
+    pages = queue.Queue(maxsize=_PAGE_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Wait for room, but give up once the stream has been closed so a
+        # worker never blocks forever on a queue nobody reads any more
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fetch(kind: str, group: str, terms: list):
+        try:
+            filter_pattern = _filter_pattern(terms)
+            for records in iter_log_pages(logs_client, group, start_time, end_time, filter_pattern):
+                if not put((kind, records, None)):
+                    return
+        except Exception as e:
+            put((kind, None, e))
+        else:
+            put((kind, None, None))
 
-    return all_spans, all_events
+    # Query both log groups at once, so retrieval costs one round-trip's
+    # worth of latency instead of two back to back
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        pool.submit(fetch, 'event', log_group, event_terms)
+        pool.submit(fetch, 'span', 'aws/spans', span_terms)
+
+        try:
+            running = 2
+            while running:
+                kind, records, error = pages.get()
+                if records is not None:
+                    for record in records:
+                        yield kind, record
+                    continue
+
+                running -= 1
+                if error is None:
+                    continue
+                if kind == 'span':
+                    # Spans are best-effort; carry on with the events
+                    print_warning(f"Error querying aws/spans: {error}")
+                    continue
+
+                # The runtime log group is required
+                if isinstance(error, logs_client.exceptions.ResourceNotFoundException):
+                    print_error(f"Log group not found: {log_group}")
+                    print(f"  Make sure the agent has been run with CloudWatch telemetry enabled.")
+                else:
+                    print_error(f"Error querying log group: {error}")
+                raise TelemetryUnavailable(log_group)
+        finally:
+            # Unblock the workers and let them give up at their next page
+            stop.set()
+
+
+def _extract_span_summary(span: dict) -> dict:
+    """Reduce a span to the few fields list_sessions displays"""
+    attrs = span.get('attributes', {})
+    return {
+        'session_id': attrs.get('session.id'),
+        'agent_name': attrs.get('gen_ai.agent.name', 'Unknown'),
+        'timestamp': span.get('startTimeUnixNano', 0),
+        'trace_id': span.get('traceId', 'Unknown'),
+    }
 
 
 def list_sessions(logs_client, agent_id: str, time_range_minutes: int = 60):
     """List available sessions for the agent"""
     print_header(f"Available Sessions for {agent_id}")
 
-    spans, events = get_cloudwatch_data(logs_client, agent_id, time_range_minutes)
-
-    if not spans and not events:
+    # Extract unique sessions, keeping each one's newest span. Spans arrive
+    # in log order, so the first one seen is not necessarily the latest.
+    # Only these summaries are kept; the records themselves are dropped.
+    sessions = {}
+    found_data = False
+    try:
+        for kind, span in get_cloudwatch_data(logs_client, agent_id, time_range_minutes):
+            found_data = True
+            if kind != 'span':
+                continue
+            session_id = span.get('attributes', {}).get('session.id')
+            if not session_id:
+                continue
+            existing = sessions.get(session_id)
+            if existing is None or span.get('startTimeUnixNano', 0) > existing['timestamp']:
+                sessions[session_id] = _extract_span_summary(span)
+    except TelemetryUnavailable:
+        found_data = False
+
+    if not found_data:
         print("\n  No data found in the specified time range.")
         return
 
-    # Extract unique sessions
-    sessions = {}
-    for span in spans:
-        session_id = span.get('attributes', {}).get('session.id')
-        if session_id and session_id not in sessions:
-            sessions[session_id] = {
-                'agent_name': span.get('attributes', {}).get('gen_ai.agent.name', 'Unknown'),
-                'timestamp': span.get('startTimeUnixNano', 0),
-                'trace_id': span.get('traceId', 'Unknown'),
-            }
-
     if not sessions:
         print("\n  No sessions found.")
         return
 
     # Sort by timestamp (newest first)
-    sorted_sessions = sorted(sessions.items(), key=lambda x: x[1]['timestamp'], reverse=True)
+    sorted_sessions = sorted(sessions.values(), key=itemgetter('timestamp'), reverse=True)
 
     print(f"\n  Found {len(sorted_sessions)} session(s):\n")
     print(f"  {'Session ID':<40} {'Agent Name':<30} {'Trace ID':<20}")
     print(f"  {'-' * 40} {'-' * 30} {'-' * 20}")
 
-    for session_id, info in sorted_sessions[:20]:  # Show last 20
+    for info in sorted_sessions[:20]:  # Show last 20
+        session_id = info['session_id']
         ts = datetime.fromtimestamp(info['timestamp'] / 1e9).strftime('%H:%M:%S') if info['timestamp'] else 'N/A'
         print(f"  {session_id:<40} {info['agent_name']:<30} {info['trace_id'][:16]}...")
 
 
-def find_latest_invoke_agent(spans: list, events: list) -> tuple[Optional[dict], Optional[dict]]:
+def index_telemetry(records: Iterable[tuple[str, dict]]) -> tuple[dict, dict, Counter]:
+    """
+    Index a get_cloudwatch_data stream once so later lookups don't rescan it.
+
+    Evaluation spans are left out of spans_by_trace here, so the span
+    name is lowercased once per span rather than by every later check.
+    The match stays case-insensitive since it also sees user-chosen agent
+    names.
+
+    Returns:
+        Tuple of (events_by_span, spans_by_trace, counts): the first event
+        for each spanId, each trace's non-evaluation spans sorted by start
+        time, and how many records of each kind were read
+    """
+    events_by_span = {}
+    spans_by_trace = defaultdict(list)
+    counts = Counter()
+
+    for kind, record in records:
+        counts[kind] += 1
+        if kind == 'span':
+            if 'evaluation' not in record.get('name', '').lower():
+                spans_by_trace[record.get('traceId')].append(record)
+        else:
+            events_by_span.setdefault(record.get('spanId'), record)
+
+    for trace_spans in spans_by_trace.values():
+        trace_spans.sort(key=lambda x: x.get('startTimeUnixNano', 0))
+
+    return events_by_span, spans_by_trace, counts
+
+
+def find_latest_invoke_agent(spans: Iterable[dict], events_by_span: dict) -> tuple[Optional[dict], Optional[dict]]:
     """
     Find the latest invoke_agent span and its corresponding log event.
 
+    Expects spans from index_telemetry, which has already dropped
+    evaluation spans.
+
     Returns:
         Tuple of (span, event) or (None, None) if not found
     """
-    # Find invoke_agent spans (excluding evaluation spans)
-    invoke_spans = [
-        s for s in spans
-        if s.get('name', '').startswith('invoke_agent ')
-        and 'evaluation' not in s.get('name', '').lower()
-    ]
-
-    if not invoke_spans:
-        return None, None
+    # Newest invoke_agent span, in one pass
+    latest_span = max(
+        (s for s in spans if s.get('name', '').startswith('invoke_agent ')),
+        key=lambda x: x.get('startTimeUnixNano', 0),
+        default=None,
+    )
 
-    # Sort by timestamp (newest first)
-    invoke_spans.sort(key=lambda x: x.get('startTimeUnixNano', 0), reverse=True)
-    latest_span = invoke_spans[0]
+    if latest_span is None:
+        return None, None
 
     # Find matching log event
-    span_id = latest_span['spanId']
-    matching_events = [e for e in events if e.get('spanId') == span_id]
-
-    if not matching_events:
-        return latest_span, None
+    return latest_span, events_by_span.get(latest_span['spanId'])
 
-    return latest_span, matching_events[0]
 
-
-def build_session_spans(spans: list, events: list, trace_id: str) -> list:
+def build_session_spans(trace_spans: list, events_by_span: dict) -> list:
     """
     Build a complete sessionSpans array for evaluation.
 
@@ -282,47 +511,51 @@ def build_session_spans(spans: list, events: list, trace_id: str) -> list:
     This ensures evaluators like Faithfulness can see tool calls and outputs.
 
     Args:
-        spans: All spans from CloudWatch
-        events: All events from CloudWatch
-        trace_id: The trace ID to filter by
+        trace_spans: One trace's spans from index_telemetry (evaluation
+            spans already removed), sorted by start time
+        events_by_span: Log events keyed by spanId
 
     Returns:
         List of spans and events for the sessionSpans parameter
     """
     session_spans = []
-
-    # Get all spans and events for this trace
-    trace_spans = [s for s in spans if s.get('traceId') == trace_id]
-    trace_events = [e for e in events if e.get('traceId') == trace_id]
-
-    # Sort spans by start time
-    trace_spans.sort(key=lambda x: x.get('startTimeUnixNano', 0))
+    # Spans sharing a spanId map to the same event object; send it only once
+    sent_events = set()
 
     for span in trace_spans:
         span_name = span.get('name', '')
 
-        # Skip evaluation spans and internal operations only
-        if 'evaluation' in span_name.lower():
-            continue
+        # Skip internal operations (evaluation spans never get this far)
         if span_name == 'InternalOperation':
             continue
         # Skip parallel_group wrapper spans (no useful info)
-        if 'parallel_group' in span_name:
+        if span_name.startswith('parallel_group'):
             continue
 
         # Include the span
         session_spans.append(span)
 
         # Add corresponding event if exists
-        span_id = span.get('spanId')
-        for event in trace_events:
-            if event.get('spanId') == span_id:
-                session_spans.append(event)
-                break
+        event = events_by_span.get(span.get('spanId'))
+        if event is not None and id(event) not in sent_events:
+            sent_events.add(id(event))
+            session_spans.append(event)
 
     return session_spans
 
 
+def _failed_result(error_msg: str) -> dict:
+    """Result dict for an evaluation that could not be completed"""
+    return {
+        'status': 'FAILED',
+        'score': 'N/A',
+        'label': 'Error',
+        'explanation': error_msg,
+        'token_usage': {'input': 0, 'output': 0, 'total': 0},
+        'evaluator_arn': 'N/A',
+    }
+
+
 def run_evaluation(
     agentcore_client,
     evaluator_id: str,
@@ -335,6 +568,8 @@ def run_evaluation(
     Returns:
         Dict with status, score, label, explanation, and token usage
     """
+    from botocore.exceptions import ClientError
+
     try:
         response = agentcore_client.evaluate(
             evaluatorId=evaluator_id,
@@ -364,23 +599,35 @@ def run_evaluation(
                 'status': 'SUCCESS',
                 'score': 'N/A',
                 'label': 'No results',
-                'explanation': json.dumps(response, indent=2, default=str),
+                'explanation': _json_dumps_pretty(response),
                 'token_usage': {'input': 0, 'output': 0, 'total': 0},
                 'evaluator_arn': 'N/A',
             }
 
+    except ClientError as e:
+        error = e.response.get('Error', {})
+        error_msg = error.get('Message') or error.get('Code') or str(e)
     except Exception as e:
         error_msg = str(e)
-        if hasattr(e, 'response'):
-            error_msg = e.response.get('Error', {}).get('Message', str(e))
-        return {
-            'status': 'FAILED',
-            'score': 'N/A',
-            'label': 'Error',
-            'explanation': error_msg,
-            'token_usage': {'input': 0, 'output': 0, 'total': 0},
-            'evaluator_arn': 'N/A',
-        }
+
+    return _failed_result(error_msg)
+
+
+def _client_config():
+    """
+    botocore Config shared by every AWS client the script creates.
+
+    Log reads and evaluations run concurrently, so pool enough keep-alive
+    connections for every worker to reuse, and back off adaptively on
+    throttling instead of failing a request outright.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=16,
+        retries={'max_attempts': 5, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+    )
 
 
 def run_evaluations(
@@ -393,9 +640,18 @@ def run_evaluations(
 ):
     """Main function to run evaluations"""
 
+    # boto3 is imported here rather than at module level so the offline
+    # paths (--help, --list-evaluators) start without paying for it
+    import boto3
+
     # Initialize clients
-    logs_client = boto3.client('logs', region_name=region)
-    agentcore_client = boto3.client('bedrock-agentcore', region_name=region)
+    client_config = _client_config()
+    logs_client = boto3.client('logs', region_name=region, config=client_config)
+    agentcore_client = boto3.client(
+        'bedrock-agentcore',
+        region_name=region,
+        config=client_config
+    )
 
     print_header(f"AgentCore Evaluations")
     print(f"\n  Agent ID: {agent_id}")
@@ -407,11 +663,15 @@ def run_evaluations(
 
     # Get CloudWatch data
     print_subheader("Retrieving Telemetry Data")
-    spans, events = get_cloudwatch_data(logs_client, agent_id, time_range_minutes, session_id)
+    records = get_cloudwatch_data(logs_client, agent_id, time_range_minutes, session_id)
+    try:
+        events_by_span, spans_by_trace, counts = index_telemetry(records)
+    except TelemetryUnavailable:
+        events_by_span, spans_by_trace, counts = {}, {}, Counter()
 
-    print(f"\n  Retrieved {len(spans)} spans and {len(events)} events from CloudWatch")
+    print(f"\n  Retrieved {counts['span']} spans and {counts['event']} events from CloudWatch")
 
-    if not spans or not events:
+    if not counts['span'] or not counts['event']:
         print_error("No telemetry data found. Make sure:")
         print("  1. The agent has been run with CloudWatch telemetry enabled")
         print("  2. The agent ID matches the configured agent")
@@ -419,7 +679,8 @@ def run_evaluations(
         return
 
     # Find latest invoke_agent span and event
-    span, event = find_latest_invoke_agent(spans, events)
+    spans = chain.from_iterable(spans_by_trace.values())
+    span, event = find_latest_invoke_agent(spans, events_by_span)
 
     if not span:
         print_error("No invoke_agent spans found in the data")
@@ -463,9 +724,10 @@ def run_evaluations(
             print(f"    Role: {output_msg.get('role')}")
             print(f"    Content: {content}...")
 
-    # Build sessionSpans for evaluation (all spans and events from trace)
+    # Build sessionSpans for evaluation (all spans and events from trace).
+    # The list is built once and shared by every evaluator's request.
     trace_id = span.get('traceId')
-    session_spans = build_session_spans(spans, events, trace_id)
+    session_spans = build_session_spans(spans_by_trace.get(trace_id, []), events_by_span)
 
     # Count what we're sending
     span_count = sum(1 for s in session_spans if 'startTimeUnixNano' in s)
@@ -475,40 +737,58 @@ def run_evaluations(
     # Run evaluations
     print_subheader("Running Evaluations")
 
-    results = []
-    for evaluator_id in evaluator_ids:
-        name = BUILTIN_EVALUATORS.get(evaluator_id, {}).get('name', evaluator_id)
-        print(f"\n  Evaluating: {name}...", end=" ", flush=True)
-
-        result = run_evaluation(agentcore_client, evaluator_id, session_spans, verbose)
-        result['evaluator_id'] = evaluator_id
-        result['name'] = name
-        results.append(result)
+    # Each evaluation is an independent, network-bound LLM call, so run them
+    # side by side and report each one as soon as it finishes
+    print(f"\n  Running {len(evaluator_ids)} evaluator(s) in parallel...")
 
-        if result['status'] == 'SUCCESS':
-            print_success(f"Score: {result['score']} ({result['label']})")
-        else:
-            print_error("Failed")
-
-        if verbose:
-            # Show token usage
-            tokens = result.get('token_usage', {})
-            if tokens.get('total', 0) > 0:
-                print(f"    Tokens: {tokens['input']} in / {tokens['output']} out ({tokens['total']} total)")
-
-            # Word wrap explanation
-            if result['explanation']:
-                print(f"\n    Explanation:")
-                words = result['explanation'].split()
-                line = "      "
-                for word in words:
-                    if len(line) + len(word) > 75:
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(evaluator_ids))) as pool:
+        futures = {
+            pool.submit(run_evaluation, agentcore_client, evaluator_id, session_spans, verbose): evaluator_id
+            for evaluator_id in evaluator_ids
+        }
+        for future in concurrent.futures.as_completed(futures):
+            evaluator_id = futures[future]
+            name = BUILTIN_EVALUATORS.get(evaluator_id, {}).get('name', evaluator_id)
+
+            # An unexpected error in one worker must not discard the
+            # results the other evaluators have already produced
+            try:
+                result = future.result()
+            except Exception as e:
+                result = _failed_result(str(e))
+            result['evaluator_id'] = evaluator_id
+            result['name'] = name
+            results.append(result)
+
+            print(f"\n  Evaluating: {name}...", end=" ")
+            if result['status'] == 'SUCCESS':
+                print_success(f"Score: {result['score']} ({result['label']})")
+            else:
+                print_error("Failed")
+
+            if verbose:
+                # Show token usage
+                tokens = result.get('token_usage', {})
+                if tokens.get('total', 0) > 0:
+                    print(f"    Tokens: {tokens['input']} in / {tokens['output']} out ({tokens['total']} total)")
+
+                # Word wrap explanation
+                if result['explanation']:
+                    print(f"\n    Explanation:")
+                    for line in textwrap.wrap(
+                        result['explanation'],
+                        width=75,
+                        initial_indent="      ",
+                        subsequent_indent="      ",
+                        break_long_words=False,
+                        break_on_hyphens=False,
+                    ):
                         print(line)
-                        line = "      " + word + " "
-                    else:
-                        line += word + " "
-                if line.strip():
-                    print(line)
+
+    # Summarize in the order the evaluators were requested
+    order = {evaluator_id: i for i, evaluator_id in enumerate(evaluator_ids)}
+    results.sort(key=lambda r: order[r['evaluator_id']])
 
     # Summary
     print_subheader("Results Summary")
@@ -538,6 +818,15 @@ def run_evaluations(
     return results
 
 
+def _evaluator_name(name: str) -> str:
+    """argparse type for --evaluators: map a short name to its full ID"""
+    evaluator_id = _NAME_TO_ID.get(name)
+    if evaluator_id is None:
+        choices = ', '.join(repr(n) for n in _NAMES)
+        raise argparse.ArgumentTypeError(f"invalid choice: {name!r} (choose from {choices})")
+    return evaluator_id
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Run AgentCore evaluations on Stood agent telemetry',
@@ -580,8 +869,9 @@ Examples:
     parser.add_argument(
         '--evaluators', '-e',
         nargs='+',
-        choices=[info['name'] for info in BUILTIN_EVALUATORS.values()],
-        help='Evaluators to run (by short name)'
+        type=_evaluator_name,
+        metavar='NAME',
+        help=f"Evaluators to run (by short name: {', '.join(_NAMES)})"
     )
 
     parser.add_argument(
@@ -628,19 +918,19 @@ Examples:
 
     # List sessions mode
     if args.list_sessions:
-        logs_client = boto3.client('logs', region_name=args.region)
+        import boto3
+        logs_client = boto3.client('logs', region_name=args.region, config=_client_config())
         list_sessions(logs_client, args.agent_id, args.time_range)
         return
 
     # Determine evaluators to run
     if args.all:
-        evaluator_ids = list(BUILTIN_EVALUATORS.keys())
+        evaluator_ids = list(_EVALUATOR_IDS)
     elif args.evaluators:
-        # Map short names to full IDs
-        name_to_id = {info['name']: eid for eid, info in BUILTIN_EVALUATORS.items()}
-        evaluator_ids = [name_to_id[name] for name in args.evaluators]
+        # Already mapped to full IDs by _evaluator_name
+        evaluator_ids = args.evaluators
     elif args.defaults:
-        evaluator_ids = [eid for eid, info in BUILTIN_EVALUATORS.items() if info['default']]
+        evaluator_ids = list(_DEFAULT_IDS)
     else:
         # Interactive selection
         evaluator_ids = interactive_select_evaluators()